@@ -1,17 +1,35 @@
-import json
-from pathlib import Path
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Dict
+from typing import Tuple
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore
 
 from rich.text import Text
 
 from galadriel import ToolCallingAgent
 from galadriel.core_agent import LogLevel
-from galadriel.domain.prompts.format_prompt import load_agent_template
+from galadriel.domain.prompts import format_prompt
 from galadriel.entities import AgentMessage
 from galadriel.entities import Message
 
-DISCORD_SYSTEM_PROMPT = """
+# Static part of the prompt, rendered once per character file so the prefix stays byte-identical across messages
+DISCORD_SYSTEM_PREFIX = """
 {{system}}
 
+Be very brief, and concise, add a statement in your voice.
+Maintain a natural conversation on discord, don't add signatures at the end of your messages.
+Don't overuse emojis.
+Please remember the chat history and use it to answer the question.
+"""
+
+# Per-message part, appended after the prefix. The persona lines are picked at random for every message
+DISCORD_USER_TEMPLATE = """
 # Areas of Expertise
 {{knowledge}}
 
@@ -22,31 +40,56 @@ DISCORD_SYSTEM_PROMPT = """
 
 # Task: You received a new message on discord from {{user_name}}. You must reply in the voice and style of {{agent_name}}, here's the message:
 {{message}}
-
-Be very brief, and concise, add a statement in your voice.
-Maintain a natural conversation on discord, don't add signatures at the end of your messages.
-Don't overuse emojis.
-Please remember the chat history and use it to answer the question.
 """
 
+# Number of (message, author) -> response pairs kept to answer repeated messages without an LLM call
+RESPONSE_CACHE_SIZE = 256
+# Seconds a cached response is reused before the question goes to the LLM again
+RESPONSE_CACHE_TTL = 60
+
 
 class CharacterAgent(ToolCallingAgent):
     def __init__(self, character_json_path: str, **kwargs):
         super().__init__(**kwargs)
+        # (message, author) -> (expiry as time.monotonic(), response)
+        self._response_cache: OrderedDict[Tuple[str, str], Tuple[float, str]] = OrderedDict()
+        self._character_mtime = 0.0
+        self._character: Dict = {}
+        self._prerendered_prefix = ""
         try:
             self.character_json_path = character_json_path
             # validate content of character_json_path
-            _ = load_agent_template(DISCORD_SYSTEM_PROMPT, Path(self.character_json_path))
+            _ = format_prompt.render_agent_template(DISCORD_USER_TEMPLATE, self._load_character())
         except Exception as e:
             self.logger.log(Text(f"Error validating character file: {e}"), level=LogLevel.ERROR)
             raise e
 
     async def execute(self, message: Message) -> Message:
         try:
-            # Load the agent template on every execution to ensure randomness
-            character_prompt = load_agent_template(DISCORD_SYSTEM_PROMPT, Path(self.character_json_path))
-            task_message = character_prompt.replace("{{message}}", message.content).replace(
-                "{{user_name}}", message.additional_kwargs["author"]
+            if os.stat(self.character_json_path).st_mtime != self._character_mtime:
+                # Read and parse the changed character file off the event loop, this also drops cached responses
+                await asyncio.to_thread(self._load_character)
+
+            # A cache hit skips the LLM and therefore the agent memory, the repeated turn isn't added to the history
+            cache_key = (" ".join(message.content.lower().split()), message.additional_kwargs["author"])
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                expiry, cached_response = cached
+                if expiry > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                    return AgentMessage(
+                        content=cached_response,
+                        conversation_id=message.conversation_id,
+                    )
+                del self._response_cache[cache_key]
+
+            character_prompt = format_prompt.render_agent_template(DISCORD_USER_TEMPLATE, self._character)
+            task_message = self._prerendered_prefix + format_prompt.execute(
+                character_prompt,
+                {
+                    "user_name": message.additional_kwargs["author"],
+                    "message": message.content,
+                },
             )
             # Use parent's run method to process the message content
             response = super().run(
@@ -58,12 +101,16 @@ class CharacterAgent(ToolCallingAgent):
             # Extract message text if response is in JSON format
             response_text = str(response)
             try:
-                response_json = json.loads(response_text)
+                response_json = _json.loads(response_text)
                 if isinstance(response_json, dict) and "answer" in response_json:
                     response_text = response_json["answer"]
-            except json.JSONDecodeError:
+            except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
                 pass  # Not JSON format, use original response
 
+            self._response_cache[cache_key] = (time.monotonic() + RESPONSE_CACHE_TTL, response_text)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
             return AgentMessage(
                 content=response_text,
                 conversation_id=message.conversation_id,
@@ -71,3 +118,14 @@ class CharacterAgent(ToolCallingAgent):
         except Exception as e:
             self.logger.log(Text(f"Error processing message: {e}"), level=LogLevel.ERROR)
             return None
+
+    def _load_character(self) -> Dict:
+        """Parse the character file and render the static prefix again only when the file has changed."""
+        mtime = os.stat(self.character_json_path).st_mtime
+        if mtime != self._character_mtime:
+            self._character = format_prompt.load_agent_data(self.character_json_path)
+            self._prerendered_prefix = format_prompt.render_agent_template(DISCORD_SYSTEM_PREFIX, self._character)
+            self._character_mtime = mtime
+            # Responses written in the old persona's voice must not be replayed
+            self._response_cache.clear()
+        return self._character
@@ -8,6 +8,7 @@ from tools import get_time
 from galadriel import AgentRuntime
 from galadriel.clients import TelegramClient
 import os
+import sys
 import asyncio
 from galadriel.logging_utils import get_agent_logger
 
@@ -38,5 +39,20 @@ runtime = AgentRuntime(
     agent=elon_musk_agent,
 )
 
+# Use the faster uvloop event loop when it is installed, it is not available on Windows
+uvloop = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
 # Run the agent
-asyncio.run(runtime.run())
+if uvloop is None:
+    asyncio.run(runtime.run())
+elif sys.version_info >= (3, 12):
+    asyncio.run(runtime.run(), loop_factory=uvloop.new_event_loop)
+else:
+    # uvloop.install() is deprecated from Python 3.12, older versions don't support a loop factory
+    uvloop.install()
+    asyncio.run(runtime.run())
@@ -1,11 +1,17 @@
-import json
-from pathlib import Path
+import asyncio
+import os
+from typing import Dict
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore
 
 from rich.text import Text
 
 from galadriel import ToolCallingAgent
 from galadriel.core_agent import LogLevel
-from galadriel.domain.prompts.format_prompt import load_agent_template
+from galadriel.domain.prompts import format_prompt
 from galadriel.entities import AgentMessage
 from galadriel.entities import Message
 
@@ -33,17 +39,23 @@ Please remember the chat history and use it to answer the question.
 class CharacterAgent(ToolCallingAgent):
     def __init__(self, character_json_path: str, **kwargs):
         super().__init__(**kwargs)
+        self._character_mtime = 0.0
+        self._character: Dict = {}
         try:
             self.character_json_path = character_json_path
             # validate content of character_json_path
-            _ = load_agent_template(TELEGRAM_SYSTEM_PROMPT, Path(self.character_json_path))
+            _ = format_prompt.render_agent_template(TELEGRAM_SYSTEM_PROMPT, self._load_character())
         except Exception as e:
             self.logger.log(Text(f"Error validating character file: {e}"), level=LogLevel.ERROR)
             raise e
 
     async def execute(self, message: Message) -> Message:
         try:
-            character_prompt = load_agent_template(TELEGRAM_SYSTEM_PROMPT, Path(self.character_json_path))
+            if os.stat(self.character_json_path).st_mtime != self._character_mtime:
+                # Read and parse the changed character file off the event loop
+                await asyncio.to_thread(self._load_character)
+            # Rendered per message so the persona values are still picked at random each time
+            character_prompt = format_prompt.render_agent_template(TELEGRAM_SYSTEM_PROMPT, self._character)
             task_message = character_prompt.replace("{{message}}", message.content).replace(
                 "{{user_name}}", message.additional_kwargs["author"]
             )
@@ -57,10 +69,10 @@ class CharacterAgent(ToolCallingAgent):
             # Extract message text if response is in JSON format
             response_text = str(response)
             try:
-                response_json = json.loads(response_text)
+                response_json = _json.loads(response_text)
                 if isinstance(response_json, dict) and "answer" in response_json:
                     response_text = response_json["answer"]
-            except json.JSONDecodeError:
+            except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
                 pass  # Not JSON format, use original response
 
             return AgentMessage(
@@ -70,3 +82,11 @@ class CharacterAgent(ToolCallingAgent):
         except Exception as e:
             self.logger.log(Text(f"Error processing message: {e}"), level=LogLevel.ERROR)
             return None
+
+    def _load_character(self) -> Dict:
+        """Parse the character file again only when it has changed."""
+        mtime = os.stat(self.character_json_path).st_mtime
+        if mtime != self._character_mtime:
+            self._character = format_prompt.load_agent_data(self.character_json_path)
+            self._character_mtime = mtime
+        return self._character
@@ -28,6 +28,12 @@ logger = get_agent_logger()
 
 DEFAULT_PROMPT_TEMPLATE = "{{request}}"
 
+# Maximum number of requests waiting to be processed, inputs pushing without waiting drop the oldest ones beyond it
+MAX_QUEUE_SIZE = 10_000
+
+# Maximum number of pending requests taken from the queue at once, their payment transactions are fetched together
+MAX_BATCH_SIZE = 16
+
 
 class Agent(ABC):
     """Abstract base class defining the interface for all agent implementations.
@@ -201,6 +207,7 @@ class AgentRuntime:
         pricing: Optional[Pricing] = None,
         debug: bool = False,
         enable_logs: bool = False,
+        max_concurrency: int = 1,
     ):
         """Initialize the AgentRuntime.
 
@@ -211,14 +218,20 @@ class AgentRuntime:
             pricing (Optional[Pricing]): Payment configuration if required
             debug (bool): Enable debug mode
             enable_logs (bool): Enable logging
+            max_concurrency (int): Maximum number of requests processed at the same time.
+                Defaults to 1, processing requests one by one in the order they arrive.
         """
         self.inputs = inputs
         self.outputs = outputs
         self.agent = agent
         self.pricing = pricing
         self.spent_payments: Set[str] = set()
+        self.rejected_payments: validate_solana_payment.RejectedPayments = {}
         self.debug = debug
         self.enable_logs = enable_logs
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
 
         env_path = Path(".") / ".env"
         _load_dotenv(dotenv_path=env_path)
@@ -231,34 +244,80 @@ class AgentRuntime:
 
         Creates an single queue and continuously processes incoming requests.
         Al agent inputs receive the same instance of the queue and append requests to it.
+        Pending requests are taken from the queue in batches, fetching all their payment transactions at once,
+        and up to max_concurrency requests are processed at the same time.
+        Each payment is only accepted right before its request runs.
         """
-        input_queue = asyncio.Queue()
+        input_queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
         push_only_queue = PushOnlyQueue(input_queue)
 
-        for agent_input in self.inputs:
-            # Each agent input receives a queue it can push messages to
-            asyncio.create_task(agent_input.start(push_only_queue))
+        # Each agent input receives a queue it can push messages to
+        tasks = [asyncio.create_task(agent_input.start(push_only_queue)) for agent_input in self.inputs]
+        tasks.append(asyncio.create_task(self._process_requests(input_queue)))
+        try:
+            # Fails as soon as any input or the processing loop fails
+            await asyncio.gather(*tasks)
+        finally:
+            # Stop everything still running on failure or when the runtime is cancelled
+            for task in tasks:
+                task.cancel()
 
-        while True:
-            # Get the next request from the queue
-            request = await input_queue.get()
-            # Process the request
-            await self._run_request(request)
-            # await self.upload_state()
+    async def _process_requests(self, input_queue: asyncio.Queue):
+        """Take requests from the queue and process them until cancelled.
 
-    async def _run_request(self, request: Message):
+        Args:
+            input_queue (asyncio.Queue): The queue agent inputs push requests to
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        running: Set[asyncio.Task] = set()
+        try:
+            while True:
+                # Get the next request from the queue, together with any other pending requests
+                requests = await _get_batch(input_queue, MAX_BATCH_SIZE)
+                sol_transferred_lamports: Optional[Dict[str, validate_solana_payment.SolTransferred]] = None
+                if self.pricing and len(requests) > 1:
+                    # Fetch the transactions of all requests in a single batched RPC call. Payments are not
+                    # accepted here, so requests still waiting for a slot when the runtime stops keep their payment.
+                    try:
+                        sol_transferred_lamports = await validate_solana_payment.fetch_many_async(
+                            self.pricing, self.spent_payments, requests, self.rejected_payments
+                        )
+                    except Exception:
+                        # Don't let an RPC failure stop the runtime, fetch each transaction on its own instead
+                        logger.exception("Batch payment fetch failed, fetching transactions one by one")
+                for request in requests:
+                    # Process the request once a slot is free
+                    await semaphore.acquire()
+                    task = asyncio.create_task(self._run_request(request, sol_transferred_lamports))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+                    task.add_done_callback(lambda t: _on_request_done(t, semaphore))
+                # await self.upload_state()
+        finally:
+            for task in list(running):
+                task.cancel()
+
+    async def _run_request(
+        self,
+        request: Message,
+        sol_transferred_lamports: Optional[Dict[str, validate_solana_payment.SolTransferred]] = None,
+    ):
         """Process a single request through the agent pipeline.
 
         Handles payment validation, agent execution, and response delivery.
 
         Args:
             request (Message): The request to process
+            sol_transferred_lamports (Optional[Dict[str, SolTransferred]]): Payment amounts by signature,
+                if the transactions were already fetched together with other requests
         """
         response = None
         # Handle payment validation
         if self.pricing:
             try:
-                task_and_payment = validate_solana_payment.execute(self.pricing, self.spent_payments, request)
+                task_and_payment = await validate_solana_payment.execute_async(
+                    self.pricing, self.spent_payments, request, sol_transferred_lamports, self.rejected_payments
+                )
                 request.content = task_and_payment.task
             except PaymentValidationError as e:
                 response = Message(content=str(e))
@@ -271,8 +330,8 @@ class AgentRuntime:
         if response:
             # proof = await self._generate_proof(request, response)
             # await self._publish_proof(request, response, proof)
-            for output in self.outputs:
-                await output.send(request, response)
+            # Outputs are independent, deliver the response to all of them at the same time
+            await asyncio.gather(*[output.send(request, response) for output in self.outputs])
 
     async def _get_memory(self) -> List[Dict[str, str]]:
         """Retrieve the current state of the agent's memory.
@@ -283,7 +342,24 @@ class AgentRuntime:
         return self.agent.write_memory_to_messages(summary_mode=True)  # type: ignore
 
     async def _generate_proof(self, request: Message, response: Message) -> str:
-        return generate_proof.execute(request, response)
+        return await asyncio.to_thread(generate_proof.execute, request, response)
 
     async def _publish_proof(self, request: Message, response: Message, proof: str):
-        publish_proof.execute(request, response, proof)
+        await asyncio.to_thread(publish_proof.execute, request, response, proof)
+
+
+async def _get_batch(queue: asyncio.Queue, max_size: int) -> List[Message]:
+    """Wait for the next request, then take up to max_size - 1 more requests that are already pending."""
+    batch = [await queue.get()]
+    while len(batch) < max_size:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+
+def _on_request_done(task: asyncio.Task, semaphore: asyncio.Semaphore) -> None:
+    semaphore.release()
+    if not task.cancelled() and task.exception():
+        logger.error("Failed to process request", exc_info=task.exception())
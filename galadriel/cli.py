@@ -1,8 +1,13 @@
+import functools
 import json
 import os
 import re
+import string
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict
 from typing import Optional
 from typing import Tuple
 
@@ -10,6 +15,8 @@ import click
 import requests
 from dotenv import dotenv_values
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # pylint: disable=import-error
 from solders.keypair import Keypair  # type: ignore
@@ -18,6 +25,33 @@ API_BASE_URL = "https://api.galadriel.com/v1"
 DEFAULT_SOLANA_KEY_PATH = os.path.expanduser("~/secret/.private_key.json")
 REQUEST_TIMEOUT = 180  # seconds
 
+DOCKER_HUB_TOKEN_TTL = 30 * 60  # seconds
+
+_NON_WORD_RE = re.compile(r"\W+")
+# Docker Hub username -> (expiry as time.monotonic(), token)
+_docker_hub_tokens: Dict[str, Tuple[float, str]] = {}
+
+# Shared session so consecutive calls to the same host reuse the TCP + TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # Retry transient platform errors on idempotent methods only, a retried POST /agents/ after a 504
+        # could create the agent twice. Once retries are exhausted the last response is returned, so callers
+        # still report the API's status code and error body.
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            raise_on_status=False,
+        ),
+    ),
+)
+
 
 @click.group(
     help="""
@@ -107,7 +141,10 @@ def deploy(image_name: str) -> None:
         docker_username, docker_password = _assert_config_files(image_name=image_name)
 
         click.echo("Building agent...")
-        _build_image(docker_username=docker_username)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Fetch the Docker Hub token while the image builds, publishing picks it up from the cache
+            executor.submit(_get_docker_hub_token, docker_username, docker_password)
+            _build_image(docker_username=docker_username)
 
         click.echo("Publishing agent...")
         _publish_image(
@@ -147,23 +184,21 @@ def update(agent_id: str, image_name: str):
 def state(agent_id: str):
     """Get information about a deployed agent from Galadriel platform."""
     try:
-        load_dotenv(dotenv_path=Path(".") / ".env", override=True)
-        api_key = os.getenv("GALADRIEL_API_KEY")
+        api_key = _env()["GALADRIEL_API_KEY"]
         if not api_key:
             raise click.ClickException("GALADRIEL_API_KEY not found in environment")
 
-        response = requests.get(
+        response = _SESSION.get(
             f"{API_BASE_URL}/agents/{agent_id}",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=REQUEST_TIMEOUT,
         )
 
         if not response.status_code == 200:
             click.echo(f"Failed to get agent state with status {response.status_code}: {response.text}")
-        click.echo(json.dumps(response.json(), indent=2))
+        else:
+            # The API already returns JSON, print it as is instead of parsing and re-serializing
+            click.echo(response.text)
     except Exception as e:
         click.echo(f"Failed to get agent state: {str(e)}")
 
@@ -172,23 +207,21 @@ def state(agent_id: str):
 def states():
     """Get all agent states"""
     try:
-        load_dotenv(dotenv_path=Path(".") / ".env", override=True)
-        api_key = os.getenv("GALADRIEL_API_KEY")
+        api_key = _env()["GALADRIEL_API_KEY"]
         if not api_key:
             raise click.ClickException("GALADRIEL_API_KEY not found in environment")
 
-        response = requests.get(
+        response = _SESSION.get(
             f"{API_BASE_URL}/agents/",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=REQUEST_TIMEOUT,
         )
 
         if not response.status_code == 200:
             click.echo(f"Failed to get agent state with status {response.status_code}: {response.text}")
-        click.echo(json.dumps(response.json(), indent=2))
+        else:
+            # The API already returns JSON, print it as is instead of parsing and re-serializing
+            click.echo(response.text)
     except Exception as e:
         click.echo(f"Failed to get agent state: {str(e)}")
 
@@ -198,17 +231,13 @@ def states():
 def destroy(agent_id: str):
     """Destroy a deployed agent from Galadriel platform."""
     try:
-        load_dotenv(dotenv_path=Path(".") / ".env", override=True)
-        api_key = os.getenv("GALADRIEL_API_KEY")
+        api_key = _env()["GALADRIEL_API_KEY"]
         if not api_key:
             raise click.ClickException("GALADRIEL_API_KEY not found in environment")
 
-        response = requests.delete(
+        response = _SESSION.delete(
             f"{API_BASE_URL}/agents/{agent_id}",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=REQUEST_TIMEOUT,
         )
 
@@ -261,7 +290,9 @@ def import_wallet(private_key: str, path: str):
         except json.JSONDecodeError:
             raise click.ClickException("Invalid private key! Please provide a valid JSON array")
         # Save the private key to the default path
-        os.makedirs(os.path.dirname(DEFAULT_SOLANA_KEY_PATH), exist_ok=True)
+        key_dir = os.path.dirname(DEFAULT_SOLANA_KEY_PATH)
+        if not os.path.isdir(key_dir):
+            os.makedirs(key_dir, exist_ok=True)
         with open(DEFAULT_SOLANA_KEY_PATH, "w", encoding="utf-8") as file:
             file.write(private_key)
         _update_agent_env_file({"SOLANA_KEY_PATH": DEFAULT_SOLANA_KEY_PATH})
@@ -275,100 +306,82 @@ def import_wallet(private_key: str, path: str):
         click.echo(f"Successfully imported Solana wallet from {path}")
 
 
+@functools.lru_cache(maxsize=1)
+def _env() -> Dict[str, Optional[str]]:
+    """Load the .env file once and return the variables used by the CLI."""
+    load_dotenv(dotenv_path=Path(".") / ".env", override=True)
+    return {
+        "GALADRIEL_API_KEY": os.getenv("GALADRIEL_API_KEY"),
+        "DOCKER_USERNAME": os.getenv("DOCKER_USERNAME"),
+        "DOCKER_PASSWORD": os.getenv("DOCKER_PASSWORD"),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _agents_env() -> Dict[str, Optional[str]]:
+    """Parse the .agents.env file once, the cache is cleared whenever the file is updated."""
+    return dict(dotenv_values(".agents.env"))
+
+
 def _assert_config_files(image_name: str) -> Tuple[str, str]:
     if not os.path.exists("docker-compose.yml"):
         raise click.ClickException("No docker-compose.yml found in current directory")
     if not os.path.exists(".env"):
         raise click.ClickException("No .env file found in current directory")
 
-    load_dotenv(dotenv_path=Path(".") / ".env", override=True)
-    docker_username = os.getenv("DOCKER_USERNAME")
-    docker_password = os.getenv("DOCKER_PASSWORD")
+    docker_username = _env()["DOCKER_USERNAME"]
+    docker_password = _env()["DOCKER_PASSWORD"]
     os.environ["IMAGE_NAME"] = image_name  # required for docker-compose.yml
     if not docker_username or not docker_password:
         raise click.ClickException("DOCKER_USERNAME or DOCKER_PASSWORD not found in .env file")
     return docker_username, docker_password
 
 
-# pylint: disable=W0613
-def _create_agent_template(agent_name: str, docker_username: str, docker_password: str, galadriel_api_key: str) -> None:
-    """
-    Generates the Python code and directory structure for a new Galadriel agent.
-
-    Args:
-        agent_name: The name of the agent (e.g., "my_daige").
-    """
-
-    # Create directories
-    agent_dir = os.path.join(agent_name, "agent")
-    # agent_configurator_dir = os.path.join(agent_name, "agent_configurator")
-    # docker_dir = os.path.join(agent_name, "docker")
-    os.makedirs(agent_dir, exist_ok=True)
-    # os.makedirs(agent_configurator_dir, exist_ok=True)
-    # os.makedirs(docker_dir)
-
-    # Generate <agent_name>.py
-    class_name = "".join(word.capitalize() for word in agent_name.split("_"))
-    agent_code = f"""from galadriel import Agent
+# Templates for the files generated by "galadriel agent init"
+_AGENT_CODE_TEMPLATE = string.Template(
+    """from galadriel import Agent
 from galadriel.entities import Message
 
 
-class {class_name}(Agent):
+class $class_name(Agent):
     async def run(self, request: Message) -> Message:
         # Implement your agent's logic here
-        print(f"Running {class_name}")
+        print(f"Running $class_name")
         return Message(
             content="TODO"
         )
 """
-    with open(os.path.join(agent_dir, f"{agent_name}.py"), "w", encoding="utf-8") as f:
-        f.write(agent_code)
-
-    # Generate <agent_name>.json
-    # initial_data = {
-    #     "name": class_name,
-    #     "description": "A brief description of your agent",
-    #     "prompt": "The initial prompt for the agent",
-    #     "tools": [],
-    # }
-    # with open(
-    #     os.path.join(agent_configurator_dir, f"{agent_name}.json"),
-    #     "w",
-    #     encoding="utf-8",
-    # ) as f:
-    #     json.dump(initial_data, f, indent=2)
+)
 
-    # generate agent.py
-    main_code = f"""import asyncio
+_MAIN_CODE_TEMPLATE = string.Template(
+    """import asyncio
 
 from galadriel import AgentOutput
 from galadriel import AgentRuntime
 from galadriel.clients import Cron
 from galadriel.entities import Message
 
-from agent.{agent_name} import {class_name}
+from agent.$agent_name import $class_name
 
 
 class GenericOutput(AgentOutput):
 
     async def send(self, request: Message, response: Message) -> None:
-        print(f"Received response: {{response.content}}")
+        print(f"Received response: {response.content}")
 
 
 if __name__ == "__main__":
-    {agent_name} = {class_name}()
+    $agent_name = $class_name()
     agent = AgentRuntime(
         inputs=[Cron(interval_seconds=30)],
         outputs=[GenericOutput()],
-        agent={agent_name},
+        agent=$agent_name,
     )
     asyncio.run(agent.run())
 """
-    with open(os.path.join(agent_name, "agent.py"), "w", encoding="utf-8") as f:
-        f.write(main_code)
+)
 
-    # Generate pyproject.toml
-    pyproject_toml = """
+_PYPROJECT_TOML = """
 [tool.poetry]
 name = "agent"
 version = "0.1.0"
@@ -383,8 +396,53 @@ galadriel = "^0.0.2"
 requires = ["poetry-core>=1.0.0"]
 build-backend = "poetry.core.masonry.api"
 """
-    with open(os.path.join(agent_name, "pyproject.toml"), "w", encoding="utf-8") as f:
-        f.write(pyproject_toml)
+
+_AGENT_ENV_TEMPLATE = string.Template('AGENT_NAME="$agent_name"')
+
+
+# pylint: disable=W0613
+def _create_agent_template(agent_name: str, docker_username: str, docker_password: str, galadriel_api_key: str) -> None:
+    """
+    Generates the Python code and directory structure for a new Galadriel agent.
+
+    Args:
+        agent_name: The name of the agent (e.g., "my_daige").
+    """
+
+    # Create directories
+    base_dir = Path(agent_name)
+    agent_dir = base_dir / "agent"
+    # agent_configurator_dir = os.path.join(agent_name, "agent_configurator")
+    # docker_dir = os.path.join(agent_name, "docker")
+    agent_dir.mkdir(parents=True, exist_ok=True)
+    # os.makedirs(agent_configurator_dir, exist_ok=True)
+    # os.makedirs(docker_dir)
+
+    # Generate <agent_name>.py
+    class_name = "".join(word.capitalize() for word in agent_name.split("_"))
+    agent_code = _AGENT_CODE_TEMPLATE.substitute(class_name=class_name)
+    (agent_dir / f"{agent_name}.py").write_text(agent_code, encoding="utf-8")
+
+    # Generate <agent_name>.json
+    # initial_data = {
+    #     "name": class_name,
+    #     "description": "A brief description of your agent",
+    #     "prompt": "The initial prompt for the agent",
+    #     "tools": [],
+    # }
+    # with open(
+    #     os.path.join(agent_configurator_dir, f"{agent_name}.json"),
+    #     "w",
+    #     encoding="utf-8",
+    # ) as f:
+    #     json.dump(initial_data, f, indent=2)
+
+    # generate agent.py
+    main_code = _MAIN_CODE_TEMPLATE.substitute(agent_name=agent_name, class_name=class_name)
+    (base_dir / "agent.py").write_text(main_code, encoding="utf-8")
+
+    # Generate pyproject.toml
+    (base_dir / "pyproject.toml").write_text(_PYPROJECT_TOML, encoding="utf-8")
 
     # Create .env and .agents.env file in the agent directory
     #     env_content = f"""DOCKER_USERNAME={docker_username}
@@ -392,9 +450,8 @@ build-backend = "poetry.core.masonry.api"
     # GALADRIEL_API_KEY={galadriel_api_key}"""
     #     with open(os.path.join(agent_name, ".env"), "w", encoding="utf-8") as f:
     #         f.write(env_content)
-    agent_env_content = f'AGENT_NAME="{agent_name}"'
-    with open(os.path.join(agent_name, ".agents.env"), "w", encoding="utf-8") as f:
-        f.write(agent_env_content)
+    agent_env_content = _AGENT_ENV_TEMPLATE.substitute(agent_name=agent_name)
+    (base_dir / ".agents.env").write_text(agent_env_content, encoding="utf-8")
 
     # copy docker files from sentience/galadriel/docker to user current directory
     # docker_files_dir = os.path.join(os.path.dirname(__file__), "docker")
@@ -426,33 +483,30 @@ def _build_image(docker_username: str) -> None:
 def _publish_image(image_name: str, docker_username: str, docker_password: str) -> None:
     """Core logic to publish the Docker image to the Docker Hub."""
 
-    # Login to Docker Hub
+    # Login to Docker Hub, fetching the Docker Hub API token in parallel
     click.echo("Logging into Docker Hub...")
-    login_process = subprocess.run(
-        ["docker", "login", "-u", docker_username, "--password-stdin"],
-        input=docker_password.encode(),
-        capture_output=True,
-        check=False,
-    )
+    password_bytes = docker_password.encode("utf-8")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        token_future = executor.submit(_get_docker_hub_token, docker_username, docker_password)
+        # stdout is never used, only stderr is read to report a failed login
+        login_process = subprocess.Popen(
+            ["docker", "login", "-u", docker_username, "--password-stdin"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        _, login_stderr = login_process.communicate(input=password_bytes)
+        token = token_future.result()
     if login_process.returncode != 0:
-        raise click.ClickException(f"Docker login failed: {login_process.stderr.decode()}")
+        raise click.ClickException(f"Docker login failed: {login_stderr.decode()}")
 
     # Create repository if it doesn't exist
     click.echo(f"Creating repository {docker_username}/{image_name} if it doesn't exist...")
     create_repo_url = f"https://hub.docker.com/v2/repositories/{docker_username}/{image_name}"
-    token_response = requests.post(
-        "https://hub.docker.com/v2/users/login/",
-        json={"username": docker_username, "password": docker_password},
-        timeout=REQUEST_TIMEOUT,
-    )
-    if token_response.status_code == 200:
-        token = token_response.json()["token"]
-        requests.post(
+    if token:
+        _SESSION.post(
             create_repo_url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"JWT {token}",
-            },
+            headers={"Authorization": f"JWT {token}"},
             json={"name": image_name, "is_private": False},
             timeout=REQUEST_TIMEOUT,
         )
@@ -463,16 +517,35 @@ def _publish_image(image_name: str, docker_username: str, docker_password: str)
     click.echo("Successfully pushed Docker image!")
 
 
+def _get_docker_hub_token(docker_username: str, docker_password: str) -> Optional[str]:
+    """Get a Docker Hub API token, returns None if the login fails.
+
+    Tokens are cached for DOCKER_HUB_TOKEN_TTL seconds.
+    """
+    cached = _docker_hub_tokens.get(docker_username)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    token_response = _SESSION.post(
+        "https://hub.docker.com/v2/users/login/",
+        json={"username": docker_username, "password": docker_password},
+        timeout=REQUEST_TIMEOUT,
+    )
+    if token_response.status_code == 200:
+        token = token_response.json()["token"]
+        _docker_hub_tokens[docker_username] = (time.monotonic() + DOCKER_HUB_TOKEN_TTL, token)
+        return token
+    return None
+
+
 def _galadriel_deploy(image_name: str, docker_username: str) -> Optional[str]:
     """Deploy agent to Galadriel platform."""
 
     if not os.path.exists(".agents.env"):
         raise click.ClickException("No .agents.env file found in current directory. Please create one.")
 
-    env_vars = dict(dotenv_values(".agents.env"))
+    env_vars = _agents_env()
 
-    load_dotenv(dotenv_path=Path(".") / ".env")
-    api_key = os.getenv("GALADRIEL_API_KEY")
+    api_key = _env()["GALADRIEL_API_KEY"]
     if not api_key:
         raise click.ClickException("GALADRIEL_API_KEY not found in environment")
 
@@ -482,11 +555,10 @@ def _galadriel_deploy(image_name: str, docker_username: str) -> Optional[str]:
         "env_vars": env_vars,
     }
     headers = {
-        "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
         "accept": "application/json",
     }
-    response = requests.post(
+    response = _SESSION.post(
         f"{API_BASE_URL}/agents/",
         json=payload,
         headers=headers,
@@ -514,10 +586,9 @@ def _galadriel_update(image_name: str, docker_username: str, agent_id: str) -> b
     if not os.path.exists(".agents.env"):
         raise click.ClickException("No .agents.env file found in current directory. Please create one.")
 
-    env_vars = dict(dotenv_values(".agents.env"))
+    env_vars = _agents_env()
 
-    load_dotenv(dotenv_path=Path(".") / ".env")
-    api_key = os.getenv("GALADRIEL_API_KEY")
+    api_key = _env()["GALADRIEL_API_KEY"]
     if not api_key:
         raise click.ClickException("GALADRIEL_API_KEY not found in environment")
 
@@ -527,11 +598,10 @@ def _galadriel_update(image_name: str, docker_username: str, agent_id: str) -> b
         "env_vars": env_vars,
     }
     headers = {
-        "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
         "accept": "application/json",
     }
-    response = requests.put(
+    response = _SESSION.put(
         f"{API_BASE_URL}/agents/{agent_id}",
         json=payload,
         headers=headers,
@@ -562,27 +632,31 @@ def _sanitize_agent_name(user_input: str) -> str:
     :param user_input: The raw folder name input from the user.
     :return: A sanitized string suitable for a folder name.
     """
-    sanitized_name = re.sub(r"\W+", "_", user_input)  # Replace non-alphanumeric characters with _
+    if user_input.isascii() and user_input.isidentifier():
+        # Already only word characters, nothing to replace. Non-ASCII identifiers can still contain
+        # characters \W matches, such as combining marks
+        return user_input.strip("_")
+    sanitized_name = _NON_WORD_RE.sub("_", user_input)  # Replace non-alphanumeric characters with _
     sanitized_name = sanitized_name.strip("_")  # Remove leading/trailing underscores
     return sanitized_name
 
 
 def _update_agent_env_file(env_vars: dict) -> None:
     """Update the .agents.env file with the new environment variables."""
-    existing_env_vars = dotenv_values(".agents.env")
+    existing_env_vars = dict(_agents_env())
 
     # Update existing values or add new ones
     existing_env_vars.update(env_vars)
 
-    agent_env_content = ""
-    for key, value in existing_env_vars.items():
-        # Wrap the string value in quotes
-        if isinstance(value, str):
-            value = f'"{value}"'
-        agent_env_content += f"\n{key}={value}"
+    # Wrap string values in quotes
+    agent_env_content = "".join(
+        f'\n{key}="{value}"' if isinstance(value, str) else f"\n{key}={value}"
+        for key, value in existing_env_vars.items()
+    )
 
     with open(".agents.env", "w", encoding="utf-8") as f:
         f.write(agent_env_content)
+    _agents_env.cache_clear()
 
 
 def _create_solana_wallet(path: str) -> str:
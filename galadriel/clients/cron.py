@@ -32,9 +32,13 @@ class Cron(AgentInput):
         Raises:
             asyncio.CancelledError: When the task is cancelled
         """
+        loop = asyncio.get_running_loop()
+        # Sleep until a fixed schedule rather than for the interval, so time spent pushing doesn't add up as drift
+        next_tick = loop.time()
         while True:
             try:
                 await queue.put(Message(content=""))
-                await asyncio.sleep(self.interval_seconds)
+                next_tick += self.interval_seconds
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
             except asyncio.CancelledError:
                 break
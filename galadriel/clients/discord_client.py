@@ -1,9 +1,11 @@
 import logging
 import os
+from typing import Dict
+from typing import List
 from typing import Optional
 
 import discord
-from discord.ext import commands
+from discord import app_commands
 
 from galadriel import AgentInput
 from galadriel import AgentOutput
@@ -11,62 +13,96 @@ from galadriel.entities import HumanMessage
 from galadriel.entities import Message
 from galadriel.entities import PushOnlyQueue
 
+# Discord rejects messages longer than 2000 characters, keep a margin
+MAX_MESSAGE_LENGTH = 1900
 
-class DiscordClient(commands.Bot, AgentInput, AgentOutput):
+
+class DiscordClient(discord.Client, AgentInput, AgentOutput):
     """A Discord bot client that can both receive and send messages.
 
     This class implements both AgentInput and AgentOutput interfaces to provide
     bidirectional communication between Discord and the agent system. It handles
-    message reception, command processing, and response delivery.
+    message reception, application command sync, and response delivery.
 
     Attributes:
         message_queue: Queue for storing received messages
-        guild_id: ID of the Discord server the bot is connected to
+        guild_id: ID of the Discord server application commands are synced with, if any
+        tree: Application command tree, synced with the guild when enabled
         logger: Logger instance for tracking bot activities
     """
 
-    def __init__(self, guild_id: str, logger: Optional[logging.Logger] = None):
+    def __init__(self, guild_id: Optional[str], logger: Optional[logging.Logger] = None, token: Optional[str] = None):
         """Initialize the Discord client.
 
         Args:
-            guild_id (str): The ID of the Discord server to connect to
+            guild_id (Optional[str]): The ID of the Discord server to sync application commands with.
+                                      Only required when GALADRIEL_SYNC_COMMANDS is set to 1
             logger (Optional[logging.Logger]): Custom logger instance. If None,
                                              creates a default logger
+            token (Optional[str]): Discord bot token. If None, read from the
+                                   DISCORD_TOKEN environment variable
+
+        Raises:
+            ValueError: If guild_id is not a valid integer ID, is missing while command sync
+                        is enabled, or no token is available
         """
-        # Set up intents
-        intents = discord.Intents.default()
-        intents.message_content = True
+        # Read once, a missing token fails here rather than as a login error when the bot starts
+        self._discord_token: str = token or os.getenv("DISCORD_TOKEN") or ""
+        if not self._discord_token:
+            raise ValueError("DISCORD_TOKEN environment variable is not set")
+
+        # Only subscribe to the events the client handles, the gateway doesn't send the others at all
+        intents = discord.Intents.none()
+        intents.guilds = True
         intents.guild_messages = True
+        intents.dm_messages = True
+        intents.message_content = True
 
-        super().__init__(command_prefix="!", intents=intents)
+        super().__init__(intents=intents)
+        # No prefix commands are used, a plain client with an application command tree avoids the Bot machinery
+        self.tree = app_commands.CommandTree(self)
         self.message_queue: Optional[PushOnlyQueue] = None
-        self.guild_id = guild_id
+        # Parsed once, an invalid guild ID fails here rather than when the bot starts
+        self.guild_id: Optional[int] = None
+        self._guild: Optional[discord.Object] = None
+        if guild_id:
+            try:
+                self.guild_id = int(guild_id)
+            except ValueError:
+                raise ValueError(f"Invalid Discord guild ID: {guild_id!r}") from None
+            self._guild = discord.Object(id=self.guild_id)
+        elif os.getenv("GALADRIEL_SYNC_COMMANDS") == "1":
+            raise ValueError("DISCORD_GUILD_ID is required when GALADRIEL_SYNC_COMMANDS is set to 1")
         self.logger = logger or logging.getLogger("discord_client")
+        # Channels responses were sent to, by channel id
+        self._channel_cache: Dict[int, discord.abc.Messageable] = {}
 
     async def on_ready(self):
         """Event handler called when the bot successfully connects to Discord.
 
         Logs the bot's connected status and username.
         """
-        self.logger.info(f"Bot connected as {self.user.name}")
+        self.logger.info("Bot connected as %s", self.user.name)
 
     async def setup_hook(self):
-        """Initialize the bot's commands and sync them with the Discord server.
+        """Sync the bot's application commands with the Discord server, if enabled.
 
-        This method is called automatically during bot startup to register
-        commands and establish the connection with the specified guild.
+        This method is called automatically during bot startup. Syncing is a rate limited
+        REST call only needed when the command set changes, so it only runs when the
+        GALADRIEL_SYNC_COMMANDS environment variable is set to 1.
 
         Raises:
             discord.HTTPException: If command synchronization fails
         """
+        if os.getenv("GALADRIEL_SYNC_COMMANDS") != "1" or self._guild is None:
+            return
 
         # Sync with specific guild
-        guild = discord.Object(id=int(self.guild_id))
         try:
-            await self.tree.sync(guild=guild)
-            self.logger.info(f"Connected to guild {self.guild_id}")
+            await self.tree.sync(guild=self._guild)
+            self.logger.info("Connected to guild %s", self.guild_id)
         except discord.HTTPException as e:
-            self.logger.error(f"Failed to sync commands to guild {self.guild_id}: {e}")
+            self.logger.error("Failed to sync commands to guild %s: %s", self.guild_id, e)
 
     # pylint: disable=W0221
     async def on_message(self, message: discord.Message):
@@ -93,26 +129,32 @@ class DiscordClient(commands.Bot, AgentInput, AgentOutput):
                 additional_kwargs={
                     "author": message.author.name,
                     "message_id": message.id,
-                    "timestamp": str(message.created_at.isoformat()),
+                    "timestamp": message.created_at.isoformat(),
                 },
             )
-            await self.message_queue.put(msg)  # type: ignore
-            self.logger.info(f"Added message to queue: {msg}")
+            # Never suspend the gateway's event handler, if the agent lags behind the oldest message is dropped
+            self.message_queue.put_nowait(msg)  # type: ignore
+            self.logger.info("Added message to queue: %s", msg)
         except Exception as e:
-            self.logger.error(f"Failed to add message to queue: {e}")
+            self.logger.error("Failed to add message to queue: %s", e)
             raise e
 
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Event handler for deleted channels, drops the channel from the channel cache."""
+        self._channel_cache.pop(channel.id, None)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        """Event handler for updated channels, drops the outdated channel from the channel cache."""
+        self._channel_cache.pop(after.id, None)
+
     async def start(self, queue: PushOnlyQueue) -> None:  # type: ignore[override]
         """Start the Discord bot and connect it to the message queue.
 
         Args:
             queue (PushOnlyQueue): Queue for storing received messages
-
-        Note:
-            Requires DISCORD_TOKEN environment variable to be set
         """
         self.message_queue = queue
-        await super().start(os.getenv("DISCORD_TOKEN", ""))
+        await super().start(self._discord_token)
 
     async def send(self, request: Message, response: Message) -> None:
         """Send a response message to the appropriate Discord channel.
@@ -128,8 +170,27 @@ class DiscordClient(commands.Bot, AgentInput, AgentOutput):
         try:
             if response.conversation_id is None:
                 raise ValueError("conversation_id cannot be None")
-            channel = self.get_channel(int(response.conversation_id))
-            await channel.send(response.content)  # type: ignore[union-attr]
+            channel_id = int(response.conversation_id)
+            channel = self._channel_cache.get(channel_id)
+            if channel is None:
+                channel = self.get_channel(channel_id)  # type: ignore[assignment]
+                if channel is not None:
+                    self._channel_cache[channel_id] = channel
+            for chunk in _split_message(response.content, MAX_MESSAGE_LENGTH):
+                await channel.send(chunk)  # type: ignore[union-attr]
         except Exception as e:
-            self.logger.error(f"Failed to post output: {e}")
+            self.logger.error("Failed to post output: %s", e)
             raise e
+
+
+def _split_message(content: str, max_length: int) -> List[str]:
+    """Split content into chunks Discord accepts, preferring to break at newlines."""
+    chunks = []
+    while len(content) > max_length:
+        split_at = content.rfind("\n", 0, max_length)
+        if split_at <= 0:
+            split_at = max_length
+        chunks.append(content[:split_at])
+        content = content[split_at:].lstrip("\n")
+    chunks.append(content)
+    return chunks
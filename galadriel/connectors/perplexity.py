@@ -1,4 +1,5 @@
 import asyncio
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone
@@ -23,6 +24,22 @@ class PerplexityClient:
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # Sessions are bound to the event loop they are created on, so they are cached per loop
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def __aenter__(self) -> "PerplexityClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session of the running event loop, if one was opened."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
 
     async def search_topic(
         self,
@@ -56,33 +73,40 @@ class PerplexityClient:
 
         timeout = 60
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout,  # type: ignore
-                ) as response:
-                    response.raise_for_status()
-
-                    response_json = await response.json()
-                    content = response_json["choices"][0]["message"]["content"]
-                    sources = "\n".join(
-                        [f"[{index + 1}] {url}" for index, url in enumerate(response_json.get("citations", []))]
-                    )
-
-                    result = PerplexitySources(
-                        content=content,
-                        sources=sources,
-                    )
-                    logger.info("API call successful")
-                    return result
+            async with self._get_session().post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=timeout,  # type: ignore
+            ) as response:
+                response.raise_for_status()
+
+                response_json = await response.json()
+                content = response_json["choices"][0]["message"]["content"]
+                sources = "\n".join(
+                    [f"[{index + 1}] {url}" for index, url in enumerate(response_json.get("citations", []))]
+                )
+
+                result = PerplexitySources(
+                    content=content,
+                    sources=sources,
+                )
+                logger.info("API call successful")
+                return result
         except asyncio.TimeoutError:
             logger.error("The request timed out.")
         except aiohttp.ClientError as e:
             logger.error(f"An error occurred: {e}")
         return None
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        # One session per client and event loop, so searches reuse its pooled keep-alive connections
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = self._sessions[loop] = aiohttp.ClientSession()
+        return session
+
 
 def _get_date_reminder():
     return datetime.now(timezone.utc).strftime(" Current date is %-d %B %Y")
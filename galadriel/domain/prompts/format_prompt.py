@@ -21,10 +21,40 @@ def load_agent_template(template: str, json_path: str) -> str:
     Returns:
         str: Updated template with randomly selected values
     """
+    return render_agent_template(template, load_agent_data(json_path))
+
+
+def load_agent_data(json_path: str) -> Dict:
+    """
+    Load agent personality data from a JSON file.
+
+    Args:
+        json_path (str): Path to the JSON file containing agent personality data
+
+    Returns:
+        Dict: The parsed agent personality data
+    """
     try:
         with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Agent personality file not found: {json_path}")
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid JSON file: {json_path}")
+
+
+def render_agent_template(template: str, data: Dict) -> str:
+    """
+    Update template with random values from already loaded agent personality data.
+
+    Args:
+        template (str): The template string containing placeholders
+        data (Dict): Agent personality data, as returned by load_agent_data
 
+    Returns:
+        str: Updated template with randomly selected values
+    """
+    try:
         agent_values = {
             "knowledge": random.choice(data.get("knowledge", [])),
             "agent_name": data.get("name"),
@@ -33,14 +63,6 @@ def load_agent_template(template: str, json_path: str) -> str:
             "lore": random.choice(data.get("lore", [])),
             "topics": random.choice(data.get("topics", [])),
         }
-
-        updated_template = execute(template, agent_values)
-
-        return updated_template
-
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Agent personality file not found: {json_path}")
-    except json.JSONDecodeError:
-        raise ValueError(f"Invalid JSON file: {json_path}")
+        return execute(template, agent_values)
     except KeyError as e:
         raise KeyError(f"Missing required key in JSON file: {e}")
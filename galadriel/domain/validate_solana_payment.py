@@ -1,8 +1,17 @@
+import asyncio
+import re
+import time
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
+from typing import Union
 
+import requests
+from requests.adapters import HTTPAdapter
 from solana.rpc.api import Client
 from solders.pubkey import Pubkey  # pylint: disable=E0401
 from solders.signature import Signature  # pylint: disable=E0401
@@ -11,6 +20,22 @@ from galadriel.entities import Message
 from galadriel.entities import Pricing
 from galadriel.errors import PaymentValidationError
 
+SOLANA_API_URL = "https://api.mainnet-beta.solana.com"
+
+# Base58 encoded 64 byte signature, usually 87-88 characters, shorter only with leading zero bytes
+_SIGNATURE_RE = re.compile(r"(?<![1-9A-HJ-NP-Za-km-z])[1-9A-HJ-NP-Za-km-z]{64,88}(?![1-9A-HJ-NP-Za-km-z])")
+
+REJECTED_SIGNATURE_TTL = 10 * 60
+MAX_REJECTED_SIGNATURES = 1024
+
+# Signature -> (expiry as time.monotonic(), reason) of transactions found on chain that don't pay for a request,
+# kept by the caller next to the existing payments so retries with the same signature skip the RPC call
+RejectedPayments = Dict[str, Tuple[float, str]]
+
+# Amount sent to the wallet by a fetched transaction, None if it was not found,
+# the PaymentValidationError if it can never pay for a request
+SolTransferred = Union[int, PaymentValidationError, None]
+
 
 @dataclass
 class TaskAndPaymentSignature:
@@ -23,18 +48,160 @@ class TaskAndPaymentSignatureResponse(TaskAndPaymentSignature):
     amount_transferred_lamport: int
 
 
-def execute(pricing: Pricing, existing_payments: Set[str], request: Message) -> TaskAndPaymentSignatureResponse:
+def execute(
+    pricing: Pricing,
+    existing_payments: Set[str],
+    request: Message,
+    rejected_payments: Optional[RejectedPayments] = None,
+) -> TaskAndPaymentSignatureResponse:
     """Validate the payment for the request.
     Args:
         pricing: Pricing configuration, containing the wallet address and payment amount required
         existing_payments: Already validated payments to avoid duplications
         request: The message containing the transaction signature
+        rejected_payments: Recently rejected payments, retries with them are rejected without an RPC call
     Returns:
         The task to be executed
     Raises:
         PaymentValidationError: If the payment validation fails
     """
-    task_and_payment = _extract_transaction_signature(request.content)
+    task_and_payment = _validate_signature(
+        _extract_transaction_signature(request.content), existing_payments, rejected_payments
+    )
+    sol_transferred_lamport = _fetch_sol_amount_transferred(pricing, task_and_payment.signature)
+    return _accept_payment(pricing, existing_payments, rejected_payments, task_and_payment, sol_transferred_lamport)
+
+
+async def execute_async(
+    pricing: Pricing,
+    existing_payments: Set[str],
+    request: Message,
+    sol_transferred_lamports: Optional[Dict[str, SolTransferred]] = None,
+    rejected_payments: Optional[RejectedPayments] = None,
+) -> TaskAndPaymentSignatureResponse:
+    """Validate the payment for the request without blocking the event loop.
+    The transaction is fetched in a worker thread, so several requests can be validated concurrently.
+    Args:
+        pricing: Pricing configuration, containing the wallet address and payment amount required
+        existing_payments: Already validated payments to avoid duplications
+        request: The message containing the transaction signature
+        sol_transferred_lamports: Amounts already fetched with fetch_many_async, by signature.
+            The transaction is only fetched if its signature is missing
+        rejected_payments: Recently rejected payments, retries with them are rejected without an RPC call
+    Returns:
+        The task to be executed
+    Raises:
+        PaymentValidationError: If the payment validation fails
+    """
+    task_and_payment = _validate_signature(
+        _extract_transaction_signature(request.content), existing_payments, rejected_payments
+    )
+    if sol_transferred_lamports is not None and task_and_payment.signature in sol_transferred_lamports:
+        sol_transferred_lamport = sol_transferred_lamports[task_and_payment.signature]
+    else:
+        sol_transferred_lamport = await asyncio.to_thread(
+            _fetch_sol_amount_transferred, pricing, task_and_payment.signature
+        )
+        # Check again, a concurrent request may have used the same signature while the transaction was fetched
+        _validate_signature(task_and_payment, existing_payments, rejected_payments)
+    return _accept_payment(pricing, existing_payments, rejected_payments, task_and_payment, sol_transferred_lamport)
+
+
+def execute_many(
+    pricing: Pricing,
+    existing_payments: Set[str],
+    messages: List[Message],
+    rejected_payments: Optional[RejectedPayments] = None,
+) -> List[Union[TaskAndPaymentSignatureResponse, PaymentValidationError]]:
+    """Validate the payments for several requests, fetching all transactions in a single batched RPC call.
+    Args:
+        pricing: Pricing configuration, containing the wallet address and payment amount required
+        existing_payments: Already validated payments to avoid duplications
+        messages: The messages containing the transaction signatures
+        rejected_payments: Recently rejected payments, they are rejected again without being fetched
+    Returns:
+        One result per message, in the same order: the task to be executed if the payment is valid,
+        the PaymentValidationError otherwise
+    """
+    tasks_and_payments = [_extract_transaction_signature(message.content) for message in messages]
+    sol_transferred_lamports = _get_sol_amounts_transferred(
+        pricing, _get_new_signatures(tasks_and_payments, existing_payments, rejected_payments)
+    )
+    return _accept_payments(pricing, existing_payments, rejected_payments, tasks_and_payments, sol_transferred_lamports)
+
+
+async def fetch_many_async(
+    pricing: Pricing,
+    existing_payments: Set[str],
+    messages: List[Message],
+    rejected_payments: Optional[RejectedPayments] = None,
+) -> Dict[str, SolTransferred]:
+    """Fetch the transactions of several requests without accepting any payment or blocking the event loop.
+    All transactions are fetched in a single batched RPC call, made in a worker thread.
+    Each payment is accepted later by execute_async, right before its request runs.
+    Args:
+        pricing: Pricing configuration, containing the wallet address and payment amount required
+        existing_payments: Already validated payments, they are not fetched again
+        messages: The messages containing the transaction signatures
+        rejected_payments: Recently rejected payments, they are not fetched again
+    Returns:
+        The amount sent to the wallet by signature, None if the transaction was not found,
+        the PaymentValidationError if it can never pay for a request
+    """
+    tasks_and_payments = [_extract_transaction_signature(message.content) for message in messages]
+    return await asyncio.to_thread(
+        _get_sol_amounts_transferred,
+        pricing,
+        _get_new_signatures(tasks_and_payments, existing_payments, rejected_payments),
+    )
+
+
+def _get_new_signatures(
+    tasks_and_payments: List[Optional[TaskAndPaymentSignature]],
+    existing_payments: Set[str],
+    rejected_payments: Optional[RejectedPayments],
+) -> List[str]:
+    return list(
+        dict.fromkeys(
+            task_and_payment.signature
+            for task_and_payment in tasks_and_payments
+            if task_and_payment
+            and task_and_payment.signature not in existing_payments
+            and not _get_rejection(rejected_payments, task_and_payment.signature)
+        )
+    )
+
+
+def _accept_payments(
+    pricing: Pricing,
+    existing_payments: Set[str],
+    rejected_payments: Optional[RejectedPayments],
+    tasks_and_payments: List[Optional[TaskAndPaymentSignature]],
+    sol_transferred_lamports: Dict[str, SolTransferred],
+) -> List[Union[TaskAndPaymentSignatureResponse, PaymentValidationError]]:
+    results: List[Union[TaskAndPaymentSignatureResponse, PaymentValidationError]] = []
+    for task_and_payment in tasks_and_payments:
+        try:
+            valid_task_and_payment = _validate_signature(task_and_payment, existing_payments, rejected_payments)
+            results.append(
+                _accept_payment(
+                    pricing,
+                    existing_payments,
+                    rejected_payments,
+                    valid_task_and_payment,
+                    sol_transferred_lamports.get(valid_task_and_payment.signature),
+                )
+            )
+        except PaymentValidationError as e:
+            results.append(e)
+    return results
+
+
+def _validate_signature(
+    task_and_payment: Optional[TaskAndPaymentSignature],
+    existing_payments: Set[str],
+    rejected_payments: Optional[RejectedPayments],
+) -> TaskAndPaymentSignature:
     if not task_and_payment:
         raise PaymentValidationError(
             "No transaction signature found in the message. Please include your payment transaction signature."
@@ -43,11 +210,32 @@ def execute(pricing: Pricing, existing_payments: Set[str], request: Message) ->
         raise PaymentValidationError(
             f"Transaction {task_and_payment.signature} has already been used. Please submit a new payment."
         )
-    sol_transferred_lamport = _get_sol_amount_transferred(pricing, task_and_payment.signature)
-    if sol_transferred_lamport < pricing.cost * 10**9:
+    rejection = _get_rejection(rejected_payments, task_and_payment.signature)
+    if rejection:
+        raise PaymentValidationError(rejection)
+    return task_and_payment
+
+
+def _accept_payment(
+    pricing: Pricing,
+    existing_payments: Set[str],
+    rejected_payments: Optional[RejectedPayments],
+    task_and_payment: TaskAndPaymentSignature,
+    sol_transferred_lamport: SolTransferred,
+) -> TaskAndPaymentSignatureResponse:
+    if isinstance(sol_transferred_lamport, PaymentValidationError):
+        raise _reject_signature(rejected_payments, task_and_payment.signature, str(sol_transferred_lamport))
+    if sol_transferred_lamport is None:
+        # Not cached, the transaction may just not be finalized yet
         raise PaymentValidationError(
+            f"Transaction {task_and_payment.signature} not found. Please wait until it is finalized and try again."
+        )
+    if sol_transferred_lamport < pricing.cost * 10**9:
+        raise _reject_signature(
+            rejected_payments,
+            task_and_payment.signature,
             f"Payment validation failed for transaction {task_and_payment.signature}. "
-            f"Please ensure you've sent {pricing.cost} SOL to {pricing.wallet_address}"
+            f"Please ensure you've sent {pricing.cost} SOL to {pricing.wallet_address}",
         )
     existing_payments.add(task_and_payment.signature)
     return TaskAndPaymentSignatureResponse(
@@ -57,21 +245,70 @@ def execute(pricing: Pricing, existing_payments: Set[str], request: Message) ->
     )
 
 
-def _get_sol_amount_transferred(pricing: Pricing, tx_signature: str) -> int:
-    http_client = Client("https://api.mainnet-beta.solana.com")
+def _get_rejection(rejected_payments: Optional[RejectedPayments], signature: str) -> Optional[str]:
+    if not rejected_payments:
+        return None
+    rejection = rejected_payments.get(signature)
+    if not rejection:
+        return None
+    if rejection[0] <= time.monotonic():
+        rejected_payments.pop(signature, None)
+        return None
+    return rejection[1]
+
+
+def _reject_signature(
+    rejected_payments: Optional[RejectedPayments], signature: str, reason: str
+) -> PaymentValidationError:
+    """Remember the signature as rejected, if rejections are kept, and return the error to raise."""
+    if rejected_payments is not None:
+        # Re-inserted so the dict stays ordered by rejection time and the oldest rejection is dropped first
+        rejected_payments.pop(signature, None)
+        rejected_payments[signature] = (time.monotonic() + REJECTED_SIGNATURE_TTL, reason)
+        while len(rejected_payments) > MAX_REJECTED_SIGNATURES:
+            del rejected_payments[next(iter(rejected_payments))]
+    return PaymentValidationError(reason)
+
+
+@lru_cache(maxsize=1)
+def _get_solana_client() -> Client:
+    """Shared RPC client, its keep-alive connection is reused across payment validations."""
+    return Client(SOLANA_API_URL, timeout=30)
+
+
+@lru_cache(maxsize=1)
+def _get_rpc_session() -> requests.Session:
+    """Keep-alive session for raw JSON-RPC requests, such as batches, not supported by the Client."""
+    session = requests.Session()
+    session.mount(SOLANA_API_URL, HTTPAdapter(pool_connections=1, pool_maxsize=10))
+    return session
+
+
+def _fetch_sol_amount_transferred(pricing: Pricing, tx_signature: str) -> SolTransferred:
+    """Return the amount sent to the wallet by the transaction, the PaymentValidationError if it can never pay."""
+    try:
+        return _get_sol_amount_transferred(pricing, tx_signature)
+    except PaymentValidationError as e:
+        return e
+
+
+def _get_sol_amount_transferred(pricing: Pricing, tx_signature: str) -> Optional[int]:
+    """Return the amount sent to the wallet by the transaction, None if the transaction is not found.
+    Raises PaymentValidationError if the transaction can never pay for a request."""
+    http_client = _get_solana_client()
     tx_sig = Signature.from_string(tx_signature)
     tx_info = http_client.get_transaction(tx_sig=tx_sig, max_supported_transaction_version=10)
     if not tx_info.value:
-        return False
+        return None
     transaction = tx_info.value.transaction.transaction  # The actual transaction
     account_keys = transaction.message.account_keys  # type: ignore
     index = _get_key_index(account_keys, pricing.wallet_address)  # type: ignore
     if index < 0:
-        return False
+        raise _wallet_not_in_accounts_error(tx_signature, pricing.wallet_address)
 
     meta = tx_info.value.transaction.meta
     if meta.err is not None:  # type: ignore
-        return False
+        raise _failed_transaction_error(tx_signature)
 
     pre_balance = meta.pre_balances[index]  # type: ignore
     post_balance = meta.post_balances[index]  # type: ignore
@@ -79,6 +316,71 @@ def _get_sol_amount_transferred(pricing: Pricing, tx_signature: str) -> int:
     return amount_sent
 
 
+def _get_sol_amounts_transferred(pricing: Pricing, tx_signatures: List[str]) -> Dict[str, SolTransferred]:
+    """Fetch several transactions in one JSON-RPC batch request and return the amount sent for each signature.
+    Transactions that can never pay for a request have their PaymentValidationError instead of an amount."""
+    if not tx_signatures:
+        return {}
+    body = [
+        {
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "getTransaction",
+            "params": [tx_signature, {"maxSupportedTransactionVersion": 10}],
+        }
+        for i, tx_signature in enumerate(tx_signatures)
+    ]
+    try:
+        responses = _get_rpc_session().post(SOLANA_API_URL, json=body, timeout=30).json()
+    except (requests.RequestException, ValueError):
+        responses = None
+    results = None
+    if isinstance(responses, list):
+        # Responses are not guaranteed to be in request order, match them by id
+        results = {response.get("id"): response.get("result") for response in responses}
+
+    amounts: Dict[str, SolTransferred] = {}
+    for i, tx_signature in enumerate(tx_signatures):
+        try:
+            if results is None:
+                # Batch requests can be rejected or rate limited by the RPC provider, fall back to one request
+                amounts[tx_signature] = _get_sol_amount_transferred(pricing, tx_signature)
+            else:
+                amounts[tx_signature] = _parse_sol_amount_transferred(
+                    results.get(i), pricing.wallet_address, tx_signature
+                )
+        except PaymentValidationError as e:
+            # Raised, and remembered as rejected, when the payment is accepted
+            amounts[tx_signature] = e
+    return amounts
+
+
+def _parse_sol_amount_transferred(tx_info: Optional[Dict], wallet_address: str, tx_signature: str) -> Optional[int]:
+    """Read the amount sent to the wallet from a raw getTransaction result."""
+    if not tx_info:
+        return None
+    account_keys = tx_info["transaction"]["message"]["accountKeys"]
+    if wallet_address not in account_keys:
+        raise _wallet_not_in_accounts_error(tx_signature, wallet_address)
+    index = account_keys.index(wallet_address)
+
+    meta = tx_info["meta"]
+    if meta["err"] is not None:
+        raise _failed_transaction_error(tx_signature)
+    return meta["postBalances"][index] - meta["preBalances"][index]
+
+
+def _wallet_not_in_accounts_error(tx_signature: str, wallet_address: str) -> PaymentValidationError:
+    return PaymentValidationError(
+        f"Transaction {tx_signature} does not transfer to {wallet_address}. "
+        f"Please send the payment to {wallet_address}",
+    )
+
+
+def _failed_transaction_error(tx_signature: str) -> PaymentValidationError:
+    return PaymentValidationError(f"Transaction {tx_signature} failed on chain. Please submit a new payment.")
+
+
 def _get_key_index(account_keys: List[Pubkey], wallet_address: str) -> int:
     """
     Returns the index of the wallet address
@@ -86,11 +388,16 @@ def _get_key_index(account_keys: List[Pubkey], wallet_address: str) -> int:
     :param wallet_address:
     :return: non-zero number if present, -1 otherwise
     """
-    wallet_key = Pubkey.from_string(wallet_address)
-    for i, key in enumerate(account_keys):
-        if wallet_key == key:
-            return i
-    return -1
+    wallet_key = _wallet_pubkey(wallet_address)
+    # Compare raw key bytes through a dict instead of calling Pubkey.__eq__ for every account
+    key_indexes = {bytes(key): i for i, key in enumerate(account_keys)}
+    return key_indexes.get(bytes(wallet_key), -1)
+
+
+@lru_cache(maxsize=128)
+def _wallet_pubkey(wallet_address: str) -> Pubkey:
+    """Decode the base58 wallet address once, it is the same for every payment validated."""
+    return Pubkey.from_string(wallet_address)
 
 
 def _extract_transaction_signature(message: str) -> Optional[TaskAndPaymentSignature]:
@@ -105,13 +412,12 @@ def _extract_transaction_signature(message: str) -> Optional[TaskAndPaymentSigna
     if not message:
         return None
 
-    if "https://solscan.io/tx/" in message:
-        task, payment = message.split("https://solscan.io/tx/")
-        task = task.strip()
-        payment_signature = payment.replace("https://solscan.io/tx/", "").strip()
+    # Single scan for the link, without a separate containment check
+    task, link, payment = message.partition("https://solscan.io/tx/")
+    if link:
         return TaskAndPaymentSignature(
-            task=task,
-            signature=payment_signature,
+            task=task.strip(),
+            signature=payment.strip(),
         )
 
     signature = _find_signature(message)
@@ -122,10 +428,16 @@ def _extract_transaction_signature(message: str) -> Optional[TaskAndPaymentSigna
 
 
 def _find_signature(message: str) -> Optional[str]:
-    for word in message.split():
-        try:
-            signature = Signature.from_string(word.strip())
-            return str(signature)
-        except Exception:
-            pass
+    # Only run the expensive signature parsing on words shaped like a signature
+    for match in _SIGNATURE_RE.finditer(message):
+        signature = _parse_signature(match.group())
+        if signature:
+            return signature
     return None
+
+
+def _parse_signature(candidate: str) -> Optional[str]:
+    try:
+        return str(Signature.from_string(candidate))
+    except Exception:
+        return None
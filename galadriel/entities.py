@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from typing import Dict
 from typing import Optional
 
@@ -7,6 +8,12 @@ from pydantic import Field
 
 GALADRIEL_API_BASE_URL = "https://api.galadriel.com/v1"
 
+# Log dropped messages once per this many drops, to avoid a log storm while the queue is full
+DROPPED_MESSAGES_LOG_INTERVAL = 1000
+
+# Same logger as galadriel.logging_utils.get_agent_logger, which can't be imported here without a cycle
+logger = logging.getLogger()
+
 
 class Message(BaseModel):
     content: str
@@ -26,10 +33,22 @@ class AgentMessage(Message):
 class PushOnlyQueue:
     def __init__(self, queue: asyncio.Queue):
         self._queue = queue
+        self.dropped = 0
 
     async def put(self, item: Message):
         await self._queue.put(item)
 
+    def put_nowait(self, item: Message):
+        """Add the item without waiting, dropping the oldest queued item if the queue is full."""
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.put_nowait(item)
+            self.dropped += 1
+            if self.dropped % DROPPED_MESSAGES_LOG_INTERVAL == 1:
+                logger.warning("Input queue is full, dropped %d oldest messages so far", self.dropped)
+
 
 class Pricing(BaseModel):
     """Represents pricing information for Galadriel Agent.
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from composio_langchain import App
 from composio_langchain import ComposioToolSet
 
@@ -18,7 +20,7 @@ def convert_action(api_key: str, action: str) -> Tool:
     Returns:
         Tool: The converted Galadriel Tool
     """
-    composio_toolset = ComposioToolSet(api_key=api_key)
+    composio_toolset = _toolset(api_key)
     return Tool.from_langchain(composio_toolset.get_tools(actions=[action])[0])
 
 
@@ -36,5 +38,11 @@ def convert_app(api_key: str, app: App) -> list[Tool]:
     Returns:
         list[Tool]: List of converted Galadriel Tools
     """
-    composio_toolset = ComposioToolSet(api_key=api_key)
+    composio_toolset = _toolset(api_key)
     return [Tool.from_langchain(tool) for tool in composio_toolset.get_tools(apps=[app])]
+
+
+@lru_cache(maxsize=32)
+def _toolset(api_key: str) -> ComposioToolSet:
+    """Return a shared ComposioToolSet per API key, so repeated conversions reuse its HTTP session."""
+    return ComposioToolSet(api_key=api_key)
@@ -18,6 +18,7 @@ Required Environment Variables:
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
 from galadriel.core_agent import Tool
@@ -260,8 +261,10 @@ class TwitterGetPostTool(TwitterApiClient, Tool):
         return json.dumps(formatted_result)
 
 
+@lru_cache(maxsize=1)
 def _get_credentials_from_env() -> TwitterCredentials:
     """Get Twitter API credentials from environment variables.
+    The credentials are read once and shared by all Twitter tools.
 
     Returns:
         TwitterCredentials: Credentials object containing API keys and tokens
@@ -276,16 +279,12 @@ def _get_credentials_from_env() -> TwitterCredentials:
         - TWITTER_ACCESS_TOKEN
         - TWITTER_ACCESS_TOKEN_SECRET
     """
-    if (
-        not os.getenv("TWITTER_CONSUMER_API_KEY")
-        or not os.getenv("TWITTER_CONSUMER_API_SECRET")
-        or not os.getenv("TWITTER_ACCESS_TOKEN")
-        or not os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-    ):
-        raise CredentialsException("Missing Twitter environment variables")
-    return TwitterCredentials(
+    credentials = TwitterCredentials(
         consumer_api_key=os.getenv("TWITTER_CONSUMER_API_KEY", ""),
         consumer_api_secret=os.getenv("TWITTER_CONSUMER_API_SECRET", ""),
         access_token=os.getenv("TWITTER_ACCESS_TOKEN", ""),
         access_token_secret=os.getenv("TWITTER_ACCESS_TOKEN_SECRET", ""),
     )
+    if not all(vars(credentials).values()):
+        raise CredentialsException("Missing Twitter environment variables")
+    return credentials
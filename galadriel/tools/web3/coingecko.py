@@ -1,8 +1,25 @@
 import os
+import threading
+import time
+from functools import lru_cache
+from typing import Dict
+from typing import Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from galadriel.core_agent import Tool
 
+# Seconds to reuse a response for, tuned to how quickly each kind of data changes
+PRICE_CACHE_TTL = 30
+HISTORICAL_DATA_CACHE_TTL = 5 * 60
+TRENDING_COINS_CACHE_TTL = 60
+MAX_CACHED_RESPONSES = 256
+
+# URL -> (expiry time, response body)
+_response_cache: Dict[str, Tuple[float, str]] = {}
+_response_cache_lock = threading.Lock()
+
 
 class CoingeckoTool(Tool):
     """Base class for Coingecko API tools.
@@ -73,7 +90,7 @@ class GetCoinPriceTool(CoingeckoTool):
             - 24-hour price change percentage
             - Last updated timestamp
         """
-        response = call_coingecko_api(
+        data = fetch_coingecko_data(
             api_key=self.api_key,
             request="https://api.coingecko.com/api/v3/simple/price"
             "?vs_currencies=usd"
@@ -83,8 +100,8 @@ class GetCoinPriceTool(CoingeckoTool):
             "&include_last_updated_at=true"
             "&precision=2"
             "&ids=" + task,
+            ttl=PRICE_CACHE_TTL,
         )
-        data = response.json()
         return data
 
 
@@ -128,11 +145,11 @@ class GetCoinHistoricalDataTool(CoingeckoTool):
         Note:
             Returns time series data including prices, market caps, and volumes
         """
-        response = call_coingecko_api(
+        data = fetch_coingecko_data(
             api_key=self.api_key,
             request="https://api.coingecko.com/api/v3/coins/" + task + "/market_chart?vs_currency=usd&days=" + days,
+            ttl=HISTORICAL_DATA_CACHE_TTL,
         )
-        data = response.json()
         return data
 
 
@@ -168,14 +185,48 @@ class FetchTrendingCoinsTool(CoingeckoTool):
         Returns:
             str: JSON string containing trending cryptocurrency data
         """
-        response = call_coingecko_api(
+        data = fetch_coingecko_data(
             api_key=self.api_key,
             request="https://api.coingecko.com/api/v3/search/trending",
+            ttl=TRENDING_COINS_CACHE_TTL,
         )
-        data = response.json()
         return data
 
 
+def fetch_coingecko_data(api_key: str, request: str, ttl: float) -> str:
+    """Fetch a Coingecko API response body, reusing a recent response for the same URL.
+
+    Args:
+        api_key (str): Coingecko API key for authentication
+        request (str): Complete API request URL
+        ttl (float): Seconds a successful response is reused for
+
+    Returns:
+        str: JSON response body from the Coingecko API
+
+    Raises:
+        requests.HTTPError: If the Coingecko API returns an error status
+    """
+    now = time.monotonic()
+    cached = _response_cache.get(request)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    response = call_coingecko_api(api_key=api_key, request=request)
+    # Errors, e.g. rate limiting, are raised before caching so the next call retries
+    response.raise_for_status()
+    # The body is already the JSON string the tools return, no need to parse it
+    data = response.text
+    with _response_cache_lock:
+        if len(_response_cache) >= MAX_CACHED_RESPONSES:
+            for url in [url for url, (expiry, _) in _response_cache.items() if expiry <= now]:
+                del _response_cache[url]
+            if len(_response_cache) >= MAX_CACHED_RESPONSES:
+                del _response_cache[next(iter(_response_cache))]
+        _response_cache[request] = (now + ttl, data)
+    return data
+
+
 def call_coingecko_api(api_key: str, request: str) -> requests.Response:
     """Make an authenticated request to the Coingecko API.
 
@@ -189,14 +240,22 @@ def call_coingecko_api(api_key: str, request: str) -> requests.Response:
     Note:
         Includes a 30-second timeout for API requests
     """
-    headers = {"accept": "application/json", "x-cg-demo-api-key": api_key}
-    return requests.get(
+    return _get_session().get(
         request,
-        headers=headers,
+        headers={"x-cg-demo-api-key": api_key},
         timeout=30,
     )
 
 
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Keep-alive session shared by all Coingecko tools, so calls reuse pooled connections."""
+    session = requests.Session()
+    session.headers.update({"accept": "application/json"})
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
+
 if __name__ == "__main__":
     get_coin_price = GetCoinPriceTool()
     print(get_coin_price.forward("ethereum"))
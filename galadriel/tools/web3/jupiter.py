@@ -1,6 +1,9 @@
 import asyncio
 import base64
-import json
+import threading
+import weakref
+from functools import lru_cache
+from typing import Dict
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Processed, Confirmed
@@ -15,8 +18,11 @@ from spl.token.constants import TOKEN_PROGRAM_ID
 
 from jupiter_python_sdk.jupiter import Jupiter
 
+from galadriel.logging_utils import get_agent_logger
 from galadriel.tools.web3.wallet_tool import WalletTool
 
+logger = get_agent_logger()
+
 
 # API endpoints for Jupiter Protocol
 SOLANA_API_URL = "https://api.mainnet-beta.solana.com"
@@ -28,6 +34,17 @@ JUPITER_QUERY_OPEN_ORDERS_API_URL = "https://jup.ag/api/limit/v1/openOrders?wall
 JUPITER_QUERY_ORDER_HISTORY_API_URL = "https://jup.ag/api/limit/v1/orderHistory"
 JUPITER_QUERY_TRADE_HISTORY_API_URL = "https://jup.ag/api/limit/v1/tradeHistory"
 
+# Clients are bound to the event loop they are used on, so they are cached per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = weakref.WeakKeyDictionary()
+_jupiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Pubkey, Jupiter]]" = weakref.WeakKeyDictionary()
+
+# Mint decimals never change, well known mints are preset and others are cached after the first lookup
+_mint_decimals: Dict[str, int] = {
+    "So11111111111111111111111111111111111111112": 9,  # Wrapped SOL
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": 6,  # USDC
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": 6,  # USDT
+}
+
 
 class SwapTokenTool(WalletTool):
     """Tool for performing token swaps using Jupiter Protocol on Solana.
@@ -68,11 +85,13 @@ class SwapTokenTool(WalletTool):
             str: A success message containing the transaction signature
 
         Note:
-            Uses asyncio to run the swap operation in an event loop
+            Runs the swap on a long-lived background event loop, so clients are reused between calls
         """
         wallet = self.wallet_repository.get_wallet()
 
-        result = asyncio.run(swap(wallet, user_address, token1, float(token2), int(amount)))
+        result = asyncio.run_coroutine_threadsafe(
+            swap(wallet, user_address, token1, float(token2), int(amount)), _get_event_loop()
+        ).result()
 
         return f"Successfully swapped {amount} {token1} for {token2}, tx sig: {result}."
 
@@ -108,30 +127,18 @@ async def swap(
         - Uses Jupiter's quote API for price discovery
         - Handles token decimal conversion
         - Confirms transaction completion
-        - Prints transaction URLs for monitoring
+        - Logs transaction URLs for monitoring at debug level
     """
-    # Initialize clients
-    async_client = AsyncClient(SOLANA_API_URL)
-    jupiter = Jupiter(
-        async_client=async_client,
-        keypair=wallet,
-        quote_api_url=JUPITER_QUOTE_API_URL,
-        swap_api_url=JUPITER_SWAP_API_URL,
-        open_order_api_url=JUPITER_OPEN_ORDER_API_URL,
-        cancel_orders_api_url=JUPITER_CANCEL_ORDERS_API_URL,
-        query_open_orders_api_url=JUPITER_QUERY_OPEN_ORDERS_API_URL,
-        query_order_history_api_url=JUPITER_QUERY_ORDER_HISTORY_API_URL,
-        query_trade_history_api_url=JUPITER_QUERY_TRADE_HISTORY_API_URL,
-    )
+    # Reuse clients, and their open connections, from previous swaps
+    async_client = _get_async_client()
+    jupiter = _get_jupiter(wallet)
 
     # Convert addresses to strings
     input_mint = str(input_mint)
     output_mint = str(output_mint)
 
     # Get token decimals and adjust amount
-    spl_client = AsyncToken(async_client, Pubkey.from_string(input_mint), TOKEN_PROGRAM_ID, wallet)
-    mint = await spl_client.get_mint_info()
-    decimals = mint.decimals
+    decimals = await _get_mint_decimals(async_client, wallet, input_mint)
     input_amount = int(input_amount * 10**decimals)
 
     try:
@@ -152,12 +159,56 @@ async def swap(
         # Send and confirm transaction
         opts = TxOpts(skip_preflight=False, preflight_commitment=Processed)
         result = await async_client.send_raw_transaction(txn=bytes(signed_txn), opts=opts)
-        print(f"Transaction sent: {json.loads(result.to_json())}")
-        transaction_id = json.loads(result.to_json())["result"]
-        print(f"Transaction sent: https://explorer.solana.com/tx/{transaction_id}")
+        transaction_id = result.value
+        logger.debug("Transaction sent: https://explorer.solana.com/tx/%s", transaction_id)
         await async_client.confirm_transaction(signature, commitment=Confirmed)
-        print(f"Transaction confirmed: https://explorer.solana.com/tx/{transaction_id}")
+        logger.debug("Transaction confirmed: https://explorer.solana.com/tx/%s", transaction_id)
         return str(signature)
 
     except Exception as e:
         raise Exception(f"Swap failed: {str(e)}")  # pylint: disable=W0719
+
+
+@lru_cache(maxsize=1)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Start the event loop swaps run on, in a daemon thread so it never blocks interpreter exit."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="jupiter-swap-loop", daemon=True).start()
+    return loop
+
+
+def _get_async_client() -> AsyncClient:
+    """Return the Solana RPC client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    async_client = _async_clients.get(loop)
+    if async_client is None:
+        async_client = _async_clients[loop] = AsyncClient(SOLANA_API_URL)
+    return async_client
+
+
+def _get_jupiter(wallet: Keypair) -> Jupiter:
+    """Return the Jupiter client for the wallet on the running event loop, creating it on first use."""
+    jupiters = _jupiters.setdefault(asyncio.get_running_loop(), {})
+    jupiter = jupiters.get(wallet.pubkey())
+    if jupiter is None:
+        jupiter = jupiters[wallet.pubkey()] = Jupiter(
+            async_client=_get_async_client(),
+            keypair=wallet,
+            quote_api_url=JUPITER_QUOTE_API_URL,
+            swap_api_url=JUPITER_SWAP_API_URL,
+            open_order_api_url=JUPITER_OPEN_ORDER_API_URL,
+            cancel_orders_api_url=JUPITER_CANCEL_ORDERS_API_URL,
+            query_open_orders_api_url=JUPITER_QUERY_OPEN_ORDERS_API_URL,
+            query_order_history_api_url=JUPITER_QUERY_ORDER_HISTORY_API_URL,
+            query_trade_history_api_url=JUPITER_QUERY_TRADE_HISTORY_API_URL,
+        )
+    return jupiter
+
+
+async def _get_mint_decimals(async_client: AsyncClient, wallet: Keypair, mint: str) -> int:
+    """Return the decimals of the token mint, only querying the chain for mints not seen before."""
+    decimals = _mint_decimals.get(mint)
+    if decimals is None:
+        spl_client = AsyncToken(async_client, Pubkey.from_string(mint), TOKEN_PROGRAM_ID, wallet)
+        decimals = _mint_decimals[mint] = (await spl_client.get_mint_info()).decimals
+    return decimals
@@ -0,0 +1,31 @@
+from galadriel.clients.discord_client import MAX_MESSAGE_LENGTH
+from galadriel.clients.discord_client import _split_message
+
+
+def test_split_message_short_content_is_one_chunk():
+    assert _split_message("hello", MAX_MESSAGE_LENGTH) == ["hello"]
+
+
+def test_split_message_exactly_max_length_is_one_chunk():
+    content = "a" * MAX_MESSAGE_LENGTH
+    assert _split_message(content, MAX_MESSAGE_LENGTH) == [content]
+
+
+def test_split_message_without_newlines_splits_at_max_length():
+    content = "a" * 5000
+    chunks = _split_message(content, MAX_MESSAGE_LENGTH)
+    assert chunks == ["a" * MAX_MESSAGE_LENGTH, "a" * MAX_MESSAGE_LENGTH, "a" * (5000 - 2 * MAX_MESSAGE_LENGTH)]
+
+
+def test_split_message_prefers_last_newline():
+    first = "a" * 1000
+    second = "b" * 1500
+    chunks = _split_message(f"{first}\n{second}", MAX_MESSAGE_LENGTH)
+    assert chunks == [first, second]
+
+
+def test_split_message_newline_at_start_splits_at_max_length():
+    content = "\n" + "a" * 2000
+    chunks = _split_message(content, MAX_MESSAGE_LENGTH)
+    assert chunks == ["\n" + "a" * (MAX_MESSAGE_LENGTH - 1), "a" * (2000 - MAX_MESSAGE_LENGTH + 1)]
+    assert all(0 < len(chunk) <= MAX_MESSAGE_LENGTH for chunk in chunks)
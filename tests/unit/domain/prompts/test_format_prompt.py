@@ -30,3 +30,17 @@ async def test_extra_values():
     }
     result = format_prompt.execute(template, state)
     assert result == "Hello world!"
+
+
+async def test_render_agent_template():
+    template = "{{agent_name}}: {{system}} {{bio}} {{lore}} {{topics}} {{knowledge}} {{message}}"
+    data = {
+        "name": "Agent",
+        "system": "system",
+        "bio": ["bio"],
+        "lore": ["lore"],
+        "topics": ["topics"],
+        "knowledge": ["knowledge"],
+    }
+    result = format_prompt.render_agent_template(template, data)
+    assert result == "Agent: system bio lore topics knowledge {{message}}"
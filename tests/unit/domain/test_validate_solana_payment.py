@@ -98,3 +98,165 @@ def test_signature_extraction_formats(monkeypatch, pricing):
             "2pcaEXQGhg9fRcMxQ3bj1La31em3fNynnTF5y1WodE56zxcvcqK3SnBjok8eYHajCJ6DxsjfrpEqtCdrEk2cxQ1Z"
             in result.signature
         )
+
+
+def test_execute_many(monkeypatch, pricing):
+    """Test batch validation returns one result per message, in order."""
+    get_amounts = MagicMock(
+        return_value={
+            "valid_signature123": pricing.cost * 10**9,
+            "invalid_payment123": pricing.cost * 10**9 - 1,
+        }
+    )
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amounts_transferred", get_amounts)
+
+    spent_payments = {"used_signature123"}
+    messages = [
+        Message(content="My task https://solscan.io/tx/valid_signature123"),
+        Message(content="My task https://solscan.io/tx/invalid_payment123"),
+        Message(content="My task https://solscan.io/tx/used_signature123"),
+        Message(content="My task without signature"),
+        Message(content="Again https://solscan.io/tx/valid_signature123"),
+    ]
+
+    results = validate_solana_payment.execute_many(pricing, spent_payments, messages)
+
+    get_amounts.assert_called_once_with(pricing, ["valid_signature123", "invalid_payment123"])
+    assert isinstance(results[0], TaskAndPaymentSignatureResponse)
+    assert results[0].task == "My task"
+    assert "Payment validation failed" in str(results[1])
+    assert "already been used" in str(results[2])
+    assert "No transaction signature found" in str(results[3])
+    assert "already been used" in str(results[4])
+    assert spent_payments == {"used_signature123", "valid_signature123"}
+
+
+def test_parse_sol_amount_transferred(pricing):
+    """Test reading the transferred amount from a raw getTransaction result."""
+    tx_info = {
+        "transaction": {"message": {"accountKeys": ["sender", pricing.wallet_address]}},
+        "meta": {"err": None, "preBalances": [500, 100], "postBalances": [300, 300]},
+    }
+    parse = validate_solana_payment._parse_sol_amount_transferred
+    assert parse(tx_info, pricing.wallet_address, "sig123") == 200
+    assert parse(None, pricing.wallet_address, "sig123") is None
+    with pytest.raises(PaymentValidationError, match="does not transfer to other_wallet"):
+        parse(tx_info, "other_wallet", "sig123")
+
+    tx_info["meta"]["err"] = {"InstructionError": [0, "Custom"]}
+    with pytest.raises(PaymentValidationError, match="failed on chain"):
+        parse(tx_info, pricing.wallet_address, "failed_sig123")
+
+
+def test_find_signature_ignores_non_signature_words():
+    """Test that only base58 words of signature length are considered."""
+    signature = "2pcaEXQGhg9fRcMxQ3bj1La31em3fNynnTF5y1WodE56zxcvcqK3SnBjok8eYHajCJ6DxsjfrpEqtCdrEk2cxQ1Z"
+    assert validate_solana_payment._find_signature(f"pay {signature}, thanks") == signature
+    assert validate_solana_payment._find_signature("short words only") is None
+    assert validate_solana_payment._find_signature("0" * 88) is None
+
+
+async def test_execute_async(monkeypatch, pricing):
+    """Test async validation accepts the payment and marks the signature as spent."""
+    monkeypatch.setattr(
+        validate_solana_payment,
+        "_get_sol_amount_transferred",
+        MagicMock(return_value=pricing.cost * 10**9),
+    )
+
+    spent_payments = set()
+    message = Message(content="My task https://solscan.io/tx/valid_signature123")
+
+    result = await validate_solana_payment.execute_async(pricing, spent_payments, message)
+
+    assert result.task == "My task"
+    assert "valid_signature123" in spent_payments
+    with pytest.raises(PaymentValidationError):
+        await validate_solana_payment.execute_async(pricing, spent_payments, message)
+
+
+async def test_fetch_many_async_does_not_accept_payments(monkeypatch, pricing):
+    """Test batch fetching returns the amounts of new signatures without spending them."""
+    get_amounts = MagicMock(return_value={"valid_signature123": pricing.cost * 10**9})
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amounts_transferred", get_amounts)
+
+    spent_payments = {"used_signature123"}
+    messages = [
+        Message(content="My task https://solscan.io/tx/valid_signature123"),
+        Message(content="Again https://solscan.io/tx/valid_signature123"),
+        Message(content="My task https://solscan.io/tx/used_signature123"),
+    ]
+
+    amounts = await validate_solana_payment.fetch_many_async(pricing, spent_payments, messages)
+
+    get_amounts.assert_called_once_with(pricing, ["valid_signature123"])
+    assert amounts == {"valid_signature123": pricing.cost * 10**9}
+    assert spent_payments == {"used_signature123"}
+
+
+async def test_execute_async_uses_fetched_amounts(monkeypatch, pricing):
+    """Test async validation accepts an already fetched amount without another RPC call."""
+    get_amount = MagicMock()
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amount_transferred", get_amount)
+
+    spent_payments = set()
+    message = Message(content="My task https://solscan.io/tx/valid_signature123")
+    amounts = {"valid_signature123": pricing.cost * 10**9}
+
+    result = await validate_solana_payment.execute_async(pricing, spent_payments, message, amounts)
+
+    get_amount.assert_not_called()
+    assert result.task == "My task"
+    assert spent_payments == {"valid_signature123"}
+    with pytest.raises(PaymentValidationError, match="already been used"):
+        await validate_solana_payment.execute_async(pricing, spent_payments, message, amounts)
+
+
+def test_rejected_signature_not_fetched_again(monkeypatch, pricing):
+    """Test a signature that failed validation is rejected again without another RPC call."""
+    get_amount = MagicMock(return_value=pricing.cost * 10**9 - 1)
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amount_transferred", get_amount)
+    message = Message(content="My task https://solscan.io/tx/invalid_payment123")
+    rejected_payments = {}
+
+    for _ in range(2):
+        with pytest.raises(PaymentValidationError) as exc_info:
+            validate_solana_payment.execute(pricing, set(), message, rejected_payments)
+        assert "Payment validation failed" in str(exc_info.value)
+
+    get_amount.assert_called_once()
+    assert "invalid_payment123" in rejected_payments
+
+    # Rejections are only shared through the dict passed in, another runtime fetches the transaction itself
+    with pytest.raises(PaymentValidationError):
+        validate_solana_payment.execute(pricing, set(), message, {})
+    assert get_amount.call_count == 2
+
+
+def test_batch_rejection_remembered_when_accepting(monkeypatch, pricing):
+    """Test a transaction rejected in a batch fetch is remembered once its payment is accepted."""
+    error = PaymentValidationError("Transaction wrong_wallet123 does not transfer to the wallet")
+    monkeypatch.setattr(
+        validate_solana_payment, "_get_sol_amounts_transferred", MagicMock(return_value={"wrong_wallet123": error})
+    )
+    messages = [Message(content="My task https://solscan.io/tx/wrong_wallet123")]
+    rejected_payments = {}
+
+    results = validate_solana_payment.execute_many(pricing, set(), messages, rejected_payments)
+
+    assert str(results[0]) == str(error)
+    assert rejected_payments["wrong_wallet123"][1] == str(error)
+
+
+def test_transaction_not_found_not_cached(monkeypatch, pricing):
+    """Test a transaction not found yet can be validated once it is available."""
+    get_amount = MagicMock(side_effect=[None, pricing.cost * 10**9])
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amount_transferred", get_amount)
+    message = Message(content="My task https://solscan.io/tx/pending_signature123")
+
+    with pytest.raises(PaymentValidationError) as exc_info:
+        validate_solana_payment.execute(pricing, set(), message)
+    assert "not found" in str(exc_info.value)
+
+    result = validate_solana_payment.execute(pricing, set(), message)
+    assert result.signature == "pending_signature123"
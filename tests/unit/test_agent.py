@@ -1,5 +1,8 @@
+import asyncio
+import contextlib
 from typing import Dict
 from typing import List
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 import pytest
@@ -90,8 +93,8 @@ async def test_payment_validation(monkeypatch):
     # Mock successful payment validation
     monkeypatch.setattr(
         validate_solana_payment,
-        "execute",
-        MagicMock(return_value=MagicMock(task="validated task", signature="sig123")),
+        "execute_async",
+        AsyncMock(return_value=MagicMock(task="validated task", signature="sig123")),
     )
 
     request = Message(content="test with payment sig123")
@@ -110,8 +113,8 @@ async def test_payment_validation_failure(monkeypatch):
 
     # Mock failed payment validation
     monkeypatch.setattr(
-        "galadriel.domain.validate_solana_payment.execute",
-        MagicMock(side_effect=PaymentValidationError("Invalid payment")),
+        "galadriel.domain.validate_solana_payment.execute_async",
+        AsyncMock(side_effect=PaymentValidationError("Invalid payment")),
     )
 
     request = Message(content="test with invalid payment")
@@ -119,3 +122,161 @@ async def test_payment_validation_failure(monkeypatch):
 
     assert output_client.output_responses[0].content == "Invalid payment"
     assert len(user_agent.called_messages) == 0
+
+
+class SlowMockAgent(Agent):
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def execute(self, request: Message) -> Message:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return RESPONSE_MESSAGE
+
+
+class MultiMessageInput(AgentInput):
+    def __init__(self, count: int):
+        self.count = count
+
+    async def start(self, queue: PushOnlyQueue):
+        for i in range(self.count):
+            await queue.put(Message(content=f"hello {i}"))
+
+
+async def _run_runtime(runtime: AgentRuntime, output_client: MockAgentOutput, expected_responses: int):
+    """Run the runtime until the output received the expected number of responses, then stop it."""
+
+    async def _wait_for_responses():
+        while len(output_client.output_responses) < expected_responses:
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(runtime.run())
+    try:
+        await asyncio.wait_for(_wait_for_responses(), timeout=5)
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def test_requests_processed_sequentially_by_default():
+    user_agent = SlowMockAgent()
+    output_client = MockAgentOutput()
+    runtime = AgentRuntime(inputs=[MultiMessageInput(3)], outputs=[output_client], agent=user_agent)
+
+    await _run_runtime(runtime, output_client, 3)
+
+    assert user_agent.max_active == 1
+    assert [r.content for r in output_client.output_requests] == ["hello 0", "hello 1", "hello 2"]
+
+
+async def test_requests_processed_concurrently():
+    user_agent = SlowMockAgent()
+    output_client = MockAgentOutput()
+    runtime = AgentRuntime(
+        inputs=[MultiMessageInput(3)],
+        outputs=[output_client],
+        agent=user_agent,
+        max_concurrency=2,
+    )
+
+    await _run_runtime(runtime, output_client, 3)
+
+    assert user_agent.max_active == 2
+    assert len(output_client.output_responses) == 3
+
+
+class PaidMessageInput(AgentInput):
+    def __init__(self, count: int):
+        self.count = count
+
+    async def start(self, queue: PushOnlyQueue):
+        for i in range(self.count):
+            await queue.put(Message(content=f"task {i} https://solscan.io/tx/sig{i}"))
+
+
+async def test_pending_requests_payments_fetched_in_batch(monkeypatch):
+    user_agent = MockAgent()
+    output_client = MockAgentOutput()
+    pricing = Pricing(cost=0.1, wallet_address="HN7cABqLq46Es1jh92dQQisAq662SmxELLLsHHe4YWrH")
+    runtime = AgentRuntime(inputs=[PaidMessageInput(3)], outputs=[output_client], agent=user_agent, pricing=pricing)
+
+    get_amounts = MagicMock(return_value={"sig0": 10**8, "sig1": 10**8 - 1, "sig2": 10**8})
+    get_amount = MagicMock()
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amounts_transferred", get_amounts)
+    monkeypatch.setattr(validate_solana_payment, "_get_sol_amount_transferred", get_amount)
+
+    await _run_runtime(runtime, output_client, 3)
+
+    get_amounts.assert_called_once_with(pricing, ["sig0", "sig1", "sig2"])
+    get_amount.assert_not_called()
+    assert [m.content for m in user_agent.called_messages] == ["task 0", "task 2"]
+    assert "Payment validation failed" in output_client.output_responses[1].content
+    assert runtime.spent_payments == {"sig0", "sig2"}
+
+
+class BlockingMockAgent(Agent):
+    def __init__(self):
+        self.started = asyncio.Event()
+
+    async def execute(self, request: Message) -> Message:
+        self.started.set()
+        await asyncio.Event().wait()
+        return RESPONSE_MESSAGE
+
+
+async def test_batched_payments_accepted_only_when_request_runs(monkeypatch):
+    user_agent = BlockingMockAgent()
+    pricing = Pricing(cost=0.1, wallet_address="HN7cABqLq46Es1jh92dQQisAq662SmxELLLsHHe4YWrH")
+    runtime = AgentRuntime(inputs=[PaidMessageInput(3)], outputs=[], agent=user_agent, pricing=pricing)
+
+    monkeypatch.setattr(
+        validate_solana_payment,
+        "_get_sol_amounts_transferred",
+        MagicMock(return_value={"sig0": 10**8, "sig1": 10**8, "sig2": 10**8}),
+    )
+
+    task = asyncio.create_task(runtime.run())
+    await asyncio.wait_for(user_agent.started.wait(), timeout=5)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    # Requests still waiting for a slot keep their payment
+    assert runtime.spent_payments == {"sig0"}
+
+
+class FailingAgentInput(AgentInput):
+    async def start(self, queue: PushOnlyQueue):
+        raise RuntimeError("input failed")
+
+
+async def test_failing_input_stops_runtime():
+    runtime = AgentRuntime(inputs=[FailingAgentInput()], outputs=[], agent=MockAgent())
+
+    with pytest.raises(RuntimeError, match="input failed"):
+        await asyncio.wait_for(runtime.run(), timeout=1)
+
+
+async def test_batch_payment_validation_failure_falls_back_to_single_validation(monkeypatch):
+    user_agent = MockAgent()
+    output_client = MockAgentOutput()
+    pricing = Pricing(cost=0.1, wallet_address="HN7cABqLq46Es1jh92dQQisAq662SmxELLLsHHe4YWrH")
+    runtime = AgentRuntime(inputs=[MultiMessageInput(2)], outputs=[output_client], agent=user_agent, pricing=pricing)
+
+    monkeypatch.setattr(
+        validate_solana_payment,
+        "_get_sol_amounts_transferred",
+        MagicMock(side_effect=RuntimeError("RPC unavailable")),
+    )
+    execute_async = AsyncMock(return_value=MagicMock(task="validated task"))
+    monkeypatch.setattr(validate_solana_payment, "execute_async", execute_async)
+
+    await _run_runtime(runtime, output_client, 2)
+
+    assert [m.content for m in user_agent.called_messages] == ["validated task", "validated task"]
+    # Without fetched amounts each request fetches its own transaction
+    assert all(call.args[3] is None for call in execute_async.call_args_list)
@@ -0,0 +1,15 @@
+import asyncio
+
+from galadriel.entities import Message
+from galadriel.entities import PushOnlyQueue
+
+
+def test_put_nowait_drops_oldest_when_full():
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    push_only_queue = PushOnlyQueue(queue)
+
+    for i in range(3):
+        push_only_queue.put_nowait(Message(content=str(i)))
+
+    assert push_only_queue.dropped == 1
+    assert [queue.get_nowait().content for _ in range(queue.qsize())] == ["1", "2"]
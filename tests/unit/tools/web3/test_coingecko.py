@@ -0,0 +1,83 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from galadriel.tools.web3 import coingecko
+
+API_KEY = "api-key"
+URL = "https://api.coingecko.com/api/v3/coins/solana"
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    coingecko._response_cache.clear()
+    yield
+    coingecko._response_cache.clear()
+
+
+def _ok_response(text: str) -> MagicMock:
+    response = MagicMock()
+    response.text = text
+    return response
+
+
+def _error_response() -> MagicMock:
+    response = MagicMock()
+    response.raise_for_status.side_effect = requests.HTTPError("429 Too Many Requests")
+    return response
+
+
+@pytest.fixture
+def api_calls(monkeypatch) -> List[str]:
+    calls: List[str] = []
+
+    def call_coingecko_api(api_key: str, request: str):
+        calls.append(request)
+        return _ok_response(f"body {len(calls)}")
+
+    monkeypatch.setattr(coingecko, "call_coingecko_api", call_coingecko_api)
+    return calls
+
+
+def test_fetch_reuses_cached_response(api_calls):
+    first = coingecko.fetch_coingecko_data(API_KEY, URL, ttl=30)
+    second = coingecko.fetch_coingecko_data(API_KEY, URL, ttl=30)
+
+    assert first == second == "body 1"
+    assert api_calls == [URL]
+
+
+def test_fetch_calls_api_again_after_ttl(api_calls, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(coingecko.time, "monotonic", lambda: now)
+    assert coingecko.fetch_coingecko_data(API_KEY, URL, ttl=30) == "body 1"
+
+    now += 31
+    assert coingecko.fetch_coingecko_data(API_KEY, URL, ttl=30) == "body 2"
+    assert api_calls == [URL, URL]
+
+
+def test_fetch_does_not_cache_http_errors(monkeypatch):
+    responses = [_error_response(), _ok_response("body")]
+    api = MagicMock(side_effect=responses)
+    monkeypatch.setattr(coingecko, "call_coingecko_api", api)
+
+    with pytest.raises(requests.HTTPError):
+        coingecko.fetch_coingecko_data(API_KEY, URL, ttl=30)
+    assert URL not in coingecko._response_cache
+
+    assert coingecko.fetch_coingecko_data(API_KEY, URL, ttl=30) == "body"
+    assert api.call_count == 2
+
+
+def test_fetch_evicts_oldest_response_at_capacity(api_calls, monkeypatch):
+    monkeypatch.setattr(coingecko, "MAX_CACHED_RESPONSES", 2)
+    urls = [f"{URL}?page={page}" for page in range(3)]
+    for url in urls:
+        coingecko.fetch_coingecko_data(API_KEY, url, ttl=30)
+
+    assert list(coingecko._response_cache) == urls[1:]
+    coingecko.fetch_coingecko_data(API_KEY, urls[0], ttl=30)
+    assert api_calls == urls + [urls[0]]